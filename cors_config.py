@@ -5,6 +5,7 @@ CORS配置模块
 """
 
 from typing import List
+import functools
 import os
 
 # CORS配置常量
@@ -34,16 +35,19 @@ class CORSConfig:
     ]
     
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def get_cors_origins() -> List[str]:
         """
         根据环境变量获取CORS允许的来源列表
-        
+
+        环境变量在进程生命周期内不会变化，因此结果只计算一次并缓存。
+
         支持的配置方式：
         1. CORS_MODE=development - 允许所有来源（*）
         2. CORS_MODE=production - 使用生产环境配置
         3. CORS_MODE=local - 允许本地开发端口
         4. CORS_ORIGINS=http://example.com,http://app.example.com - 自定义来源
-        
+
         Returns:
             List[str]: 允许的CORS来源列表
         """
@@ -67,10 +71,13 @@ class CORSConfig:
             return CORSConfig.DEVELOPMENT_ORIGINS
     
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def get_cors_config() -> dict:
         """
         获取完整的CORS配置
-        
+
+        结果在首次调用后缓存，后续调用（如每次 /cors-test 请求）直接返回同一份配置。
+
         Returns:
             dict: CORS中间件配置参数
         """
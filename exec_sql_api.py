@@ -1,27 +1,46 @@
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException, Request, BackgroundTasks
-from fastapi.responses import JSONResponse
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Dict, Any, Optional, List, Union, Set
 import asyncio
+import functools
 import traceback
 import aiomysql
 import asyncpg
 import logging
+import queue
+import re
 import time
 import os
-from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import QueueHandler, QueueListener
 from cors_config import CORSConfig
 
-# 配置日志
-logging.basicConfig(level=logging.INFO)
+# 配置日志：记录只入队，由后台线程写出，慢速stderr不会阻塞事件循环
+_log_queue: queue.Queue = queue.Queue(-1)
+logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(_log_queue)])
+_log_listener = QueueListener(_log_queue, logging.StreamHandler())
+_log_listener.start()
 logger = logging.getLogger(__name__)
 
+# 是否在错误响应中附带完整堆栈（环境变量进程内不变，启动时读取一次）
+_DEBUG = os.getenv("DEBUG", "").lower() in ("1", "true", "yes")
+
 # 定义连接池字典
 mysql_pools: Dict[str, aiomysql.Pool] = {}
 pg_pools: Dict[str, asyncpg.Pool] = {}
-thread_pool = ThreadPoolExecutor(max_workers=20)
+
+# 按键名的连接池创建锁，防止冷启动时并发请求重复建池
+_pool_locks: Dict[str, asyncio.Lock] = {}
+_pool_locks_guard = asyncio.Lock()
+
+
+async def _get_pool_lock(pool_key: str) -> asyncio.Lock:
+    """获取指定键名的创建锁（锁字典本身由_pool_locks_guard保护）"""
+    async with _pool_locks_guard:
+        return _pool_locks.setdefault(pool_key, asyncio.Lock())
 
 
 # 使用 lifespan 替代 on_event
@@ -37,25 +56,26 @@ async def lifespan(app: FastAPI):
 
     # 关闭所有MySQL连接池
     for key, pool in mysql_pools.items():
-        logger.info(f"关闭MySQL连接池: {key}")
+        logger.info("关闭MySQL连接池: %s", key)
         pool.close()
         await pool.wait_closed()
 
     # 关闭所有PostgreSQL连接池
     for key, pool in pg_pools.items():
-        logger.info(f"关闭PostgreSQL连接池: {key}")
+        logger.info("关闭PostgreSQL连接池: %s", key)
         await pool.close()
 
-    # 关闭线程池
-    thread_pool.shutdown()
     logger.info("所有资源已清理完毕")
+    # 停止日志监听线程（stop会先把队列中剩余记录写完）
+    _log_listener.stop()
 
 
 # 创建FastAPI应用并使用lifespan
 app = FastAPI(
     title="SQL执行服务",
     description="支持MySQL和PostgreSQL的SQL执行API",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse  # orjson序列化大结果集明显快于标准库json
 )
 
 # 配置CORS中间件
@@ -72,6 +92,8 @@ app.add_middleware(
 
 # 定义输入模型
 class ConnectionInfo(BaseModel):
+    model_config = ConfigDict(extra='forbid', frozen=True, str_strip_whitespace=True)
+
     db_type: str = Field(default="mysql", description="数据库类型：mysql或postgresql")
     host: str = Field(default="localhost", description="数据库主机地址")
     user: str = Field(..., description="数据库用户名")
@@ -84,13 +106,17 @@ class ConnectionInfo(BaseModel):
 
 
 class SQLRequest(BaseModel):
+    model_config = ConfigDict(extra='forbid', frozen=True, str_strip_whitespace=True)
+
     sql: str = Field(..., description="要执行的SQL语句")
     connection_info: ConnectionInfo
-    async_mode: bool = Field(default=True, description="是否异步执行")
+    async_mode: bool = Field(default=True, description="是否异步执行（已废弃，所有SQL均通过异步连接池执行）")
 
 
 # 定义统一的响应模型
 class SQLResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     success: bool = Field(description="操作是否成功")
     result: Optional[Any] = Field(None, description="查询结果或受影响的行数")
     error: Optional[Dict[str, Any]] = Field(None, description="错误信息")
@@ -106,38 +132,68 @@ async def http_exception_handler(request: Request, exc: HTTPException):
         "error": exc.detail if isinstance(exc.detail, dict) else {"message": str(exc.detail)},
         "execution_time": None
     }
-    return JSONResponse(status_code=exc.status_code, content=response)
+    return ORJSONResponse(status_code=exc.status_code, content=response)
 
 
 # 全局异常处理器
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
+    # 堆栈写入日志即可，默认不在响应路径上格式化、也不向客户端泄露内部细节
+    logger.exception("未处理的异常: %s", exc)
     error_info = {
         "message": str(exc),
-        "type": type(exc).__name__,
-        "traceback": traceback.format_exc()
+        "type": type(exc).__name__
     }
+    if _DEBUG:
+        error_info["traceback"] = traceback.format_exc()
     response = {
         "success": False,
         "result": None,
         "error": error_info,
         "execution_time": None
     }
-    return JSONResponse(status_code=500, content=response)
+    return ORJSONResponse(status_code=500, content=response)
+
+
+# Markdown代码围栏（```sql ... ```），一次sub即可去除，避免两遍全量replace
+_FENCE_RE = re.compile(r"```(?:sql)?")
+
+# 读语句关键字（SELECT/WITH/SHOW）
+_READ_KEYWORDS = ("select", "with", "show")
+
+
+def _is_read_sql(sql: str) -> bool:
+    """判断SQL是否为读查询，只检查首个关键字，避免对整条SQL做小写拷贝"""
+    return sql.lstrip()[:6].lower().startswith(_READ_KEYWORDS)
 
 
 # 生成连接池键名
+@functools.lru_cache(maxsize=1024)
+def _pool_key(db_type: str, host: str, port: Optional[int], database: str, user: str) -> str:
+    """按五元组拼接连接池键名，相同连接参数直接命中缓存"""
+    return f"{db_type}_{host}_{port}_{database}_{user}"
+
+
 def get_pool_key(connection_info: Dict[str, Any]) -> str:
     """生成唯一的连接池键名"""
-    return f"{connection_info['db_type']}_{connection_info['host']}_{connection_info['port']}_{connection_info['database']}_{connection_info['user']}"
+    return _pool_key(
+        connection_info['db_type'],
+        connection_info['host'],
+        connection_info['port'],
+        connection_info['database'],
+        connection_info['user']
+    )
 
 
-# 获取MySQL连接池
-async def get_mysql_pool(connection_info: Dict[str, Any]) -> aiomysql.Pool:
-    """获取或创建MySQL连接池"""
-    pool_key = get_pool_key(connection_info)
+# 创建MySQL连接池（慢路径；稳态下调用处直接命中mysql_pools字典，不进入协程）
+async def _create_mysql_pool(connection_info: Dict[str, Any], pool_key: str) -> aiomysql.Pool:
+    """创建MySQL连接池并登记到mysql_pools"""
+    lock = await _get_pool_lock(pool_key)
+    async with lock:
+        # 双重检查：等锁期间可能已有请求完成了建池
+        if pool_key in mysql_pools:
+            return mysql_pools[pool_key]
 
-    if pool_key not in mysql_pools:
         host = connection_info.get("host")
         user = connection_info.get("user")
         password = connection_info.get("password")
@@ -147,7 +203,7 @@ async def get_mysql_pool(connection_info: Dict[str, Any]) -> aiomysql.Pool:
         min_size = connection_info.get("min_size", 5)
         max_size = connection_info.get("max_size", 20)
 
-        logger.info(f"Creating new MySQL pool for {pool_key}")
+        logger.info("Creating new MySQL pool for %s", pool_key)
         pool = await aiomysql.create_pool(
             host=host,
             port=port,
@@ -160,16 +216,18 @@ async def get_mysql_pool(connection_info: Dict[str, Any]) -> aiomysql.Pool:
             autocommit=False
         )
         mysql_pools[pool_key] = pool
-
-    return mysql_pools[pool_key]
+        return pool
 
 
-# 获取PostgreSQL连接池
-async def get_pg_pool(connection_info: Dict[str, Any]) -> asyncpg.Pool:
-    """获取或创建PostgreSQL连接池"""
-    pool_key = get_pool_key(connection_info)
+# 创建PostgreSQL连接池（慢路径；稳态下调用处直接命中pg_pools字典，不进入协程）
+async def _create_pg_pool(connection_info: Dict[str, Any], pool_key: str) -> asyncpg.Pool:
+    """创建PostgreSQL连接池并登记到pg_pools"""
+    lock = await _get_pool_lock(pool_key)
+    async with lock:
+        # 双重检查：等锁期间可能已有请求完成了建池
+        if pool_key in pg_pools:
+            return pg_pools[pool_key]
 
-    if pool_key not in pg_pools:
         host = connection_info.get("host")
         user = connection_info.get("user")
         password = connection_info.get("password")
@@ -178,7 +236,9 @@ async def get_pg_pool(connection_info: Dict[str, Any]) -> asyncpg.Pool:
         min_size = connection_info.get("min_size", 5)
         max_size = connection_info.get("max_size", 20)
 
-        logger.info(f"Creating new PostgreSQL pool for {pool_key}")
+        logger.info("Creating new PostgreSQL pool for %s", pool_key)
+        # statement_cache_size：asyncpg按连接维护预编译语句LRU，重复SQL跳过parse/plan；
+        # 预编译语句绑定在单个连接上，不能跨连接共享，因此只放大内置缓存
         pool = await asyncpg.create_pool(
             user=user,
             password=password,
@@ -187,60 +247,75 @@ async def get_pg_pool(connection_info: Dict[str, Any]) -> asyncpg.Pool:
             port=port,
             min_size=min_size,
             max_size=max_size,
-            command_timeout=60
+            command_timeout=60,
+            statement_cache_size=256
         )
         pg_pools[pool_key] = pool
+        return pool
 
-    return pg_pools[pool_key]
+
+# 错误分类表：按顺序取首个命中的类别，整条错误消息只扫描一次
+_ERR_TABLE = (
+    (re.compile(r"connection|timeout", re.I), "连接错误", "请检查数据库连接参数是否正确，数据库服务是否可用"),
+    (re.compile(r"syntax|parse", re.I), "SQL语法错误", "请检查SQL语句的语法是否正确"),
+    (re.compile(r"integrity|constraint", re.I), "数据完整性错误", "操作违反了数据库完整性约束"),
+)
+_ERR_DEFAULT = ("其他数据库错误", "请检查SQL语句和数据库状态")
+
+
+def _classify_db_error(message: str):
+    """按关键字将数据库错误归类，返回(类别, 建议)"""
+    for pattern, category, suggestion in _ERR_TABLE:
+        if pattern.search(message):
+            return category, suggestion
+    return _ERR_DEFAULT
 
 
 # 异步执行SQL
-async def execute_sql_async(sql: str, connection_info: Dict[str, Any]) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
-    """异步执行SQL语句并返回结果"""
-    start_time = time.time()
+async def execute_sql_async(sql: str, connection_info: Dict[str, Any], start_time: float) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
+    """异步执行SQL语句并返回结果
+
+    start_time为调用方取的perf_counter起点，错误耗时据此计算，不再另起计时。
+    """
     db_type = connection_info.get("db_type", "mysql").lower()
+    pool_key = get_pool_key(connection_info)
 
     try:
         if db_type == "mysql":
-            return await execute_mysql_async(sql, connection_info)
+            return await execute_mysql_async(sql, connection_info, pool_key)
         elif db_type in ("postgresql", "postgres"):
-            return await execute_pg_async(sql, connection_info)
+            return await execute_pg_async(sql, connection_info, pool_key)
         else:
             raise ValueError(f"不支持的数据库类型: {db_type}")
     except Exception as e:
+        message = str(e)
+        category, suggestion = _classify_db_error(message)
         error_details = {
             "type": type(e).__name__,
-            "message": str(e),
+            "message": message,
             "sql": sql,
-            "execution_time": time.time() - start_time
+            "execution_time": time.perf_counter() - start_time,
+            "category": category,
+            "suggestion": suggestion
         }
-        if "connection" in str(e).lower() or "timeout" in str(e).lower():
-            error_details["category"] = "连接错误"
-            error_details["suggestion"] = "请检查数据库连接参数是否正确，数据库服务是否可用"
-        elif "syntax" in str(e).lower() or "parse" in str(e).lower():
-            error_details["category"] = "SQL语法错误"
-            error_details["suggestion"] = "请检查SQL语句的语法是否正确"
-        elif "integrity" in str(e).lower() or "constraint" in str(e).lower():
-            error_details["category"] = "数据完整性错误"
-            error_details["suggestion"] = "操作违反了数据库完整性约束"
-        else:
-            error_details["category"] = "其他数据库错误"
-            error_details["suggestion"] = "请检查SQL语句和数据库状态"
         raise HTTPException(status_code=500, detail=error_details)
 
 # MySQL异步执行
-async def execute_mysql_async(sql: str, connection_info: Dict[str, Any]) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
-    pool = await get_mysql_pool(connection_info)
+async def execute_mysql_async(sql: str, connection_info: Dict[str, Any], pool_key: str) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
+    # 稳态下连接池已存在，直接查字典，避免每次执行都多一次协程调度
+    pool = mysql_pools.get(pool_key)
+    if pool is None:
+        pool = await _create_mysql_pool(connection_info, pool_key)
     async with pool.acquire() as conn:
         async with conn.cursor(aiomysql.DictCursor) as cursor:
             await cursor.execute(sql)
-            if sql.strip().lower().startswith(("select", "with", "show")):
+            if _is_read_sql(sql):
                 rows = await cursor.fetchall()
                 # 检查是否为单行且所有值都是 None
                 if rows and len(rows) == 1 and all(value is None for value in rows[0].values()):
                     return []
-                result = [dict(row) for row in rows]
-                return result
+                # DictCursor已经返回字典列表，直接使用，无需逐行重建
+                return rows
             else:
                 await conn.commit()
                 return {"affected_rows": cursor.rowcount}
@@ -249,11 +324,64 @@ async def execute_mysql_async(sql: str, connection_info: Dict[str, Any]) -> Unio
 
 from decimal import Decimal, ROUND_HALF_UP
 
-async def execute_pg_async(sql: str, connection_info: Dict[str, Any]) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
+# 两位小数量化常量，避免在每个单元格上重复从字符串构造Decimal
+_Q2 = Decimal('0.00')
+_ROUND = ROUND_HALF_UP
+
+
+def _decimal_conv(value):
+    """Decimal转浮点数，保留两位小数"""
+    if value is None:
+        return None
+    exponent = value.as_tuple().exponent
+    if isinstance(exponent, int) and exponent >= -2:
+        # 已经不超过两位小数，无需量化
+        return float(value)
+    return float(value.quantize(_Q2, rounding=_ROUND))
+
+
+def _float_conv(value):
+    """float四舍五入到两位小数"""
+    return round(value, 2) if value is not None else None
+
+
+def _build_pg_converters(rows, keys):
+    """按列探测类型，构建逐列转换器列表
+
+    列类型在整个结果集中是固定的，探测一次即可，避免对每个单元格
+    重复做isinstance判断。首行某列为None时向后查找首个非None样本。
+    """
+    converters = []
+    for idx in range(len(keys)):
+        sample = rows[0][idx]
+        if sample is None:
+            for row in rows:
+                if row[idx] is not None:
+                    sample = row[idx]
+                    break
+        if isinstance(sample, Decimal):
+            converters.append(_decimal_conv)
+        elif isinstance(sample, float):
+            converters.append(_float_conv)
+        else:
+            converters.append(None)
+    return converters
+
+
+def _process_pg_row(row, keys, converters):
+    """按下标访问Record并套用列转换器，生成普通字典"""
+    return dict(zip(keys, (conv(row[i]) if conv else row[i]
+                           for i, conv in enumerate(converters))))
+
+
+async def execute_pg_async(sql: str, connection_info: Dict[str, Any], pool_key: str) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
     """异步执行PostgreSQL SQL语句，并保留数值结果为两位小数"""
-    pool = await get_pg_pool(connection_info)
+    # 稳态下连接池已存在，直接查字典，避免每次执行都多一次协程调度
+    pool = pg_pools.get(pool_key)
+    if pool is None:
+        pool = await _create_pg_pool(connection_info, pool_key)
     async with pool.acquire() as conn:
-        if sql.strip().lower().startswith(("select", "with", "show")):
+        if _is_read_sql(sql):
             rows = await conn.fetch(sql)
             # 如果没有查询到任何行，返回空列表
             if not rows:
@@ -261,22 +389,10 @@ async def execute_pg_async(sql: str, connection_info: Dict[str, Any]) -> Union[L
             # 检查是否为单行且所有值都是 None
             if rows and len(rows) == 1 and all(value is None for value in rows[0].values()):
                 return []
-            # 处理查询结果
-            result = []
-            for row in rows:
-                processed_row = {}
-                for key, value in row.items():
-                    if isinstance(value, Decimal):
-                        # 处理Decimal类型，保留两位小数并转为浮点数
-                        rounded = value.quantize(Decimal('0.00'), rounding=ROUND_HALF_UP)
-                        processed_row[key] = float(rounded)
-                    elif isinstance(value, float):
-                        # 处理float，四舍五入到两位小数
-                        processed_row[key] = round(value, 2)
-                    else:
-                        processed_row[key] = value
-                result.append(processed_row)
-            return result
+            # 处理查询结果：按列构建一次转换器，一次列表推导生成整个结果集
+            keys = tuple(rows[0].keys())
+            converters = _build_pg_converters(rows, keys)
+            return [_process_pg_row(row, keys, converters) for row in rows]
         else:
             result = await conn.execute(sql)
             if result:
@@ -290,83 +406,18 @@ async def execute_pg_async(sql: str, connection_info: Dict[str, Any]) -> Union[L
                 result = {"affected_rows": 0}
             return result
 
-# 同步代码包装函数（用于非异步执行）
-def execute_sql_sync(sql: str, connection_info: Dict[str, Any]) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
-    """在线程池中执行同步SQL"""
-    import pymysql
-    import psycopg2
-    from psycopg2.extras import RealDictCursor
-
-    db_type = connection_info.get("db_type", "mysql").lower()
-    host = connection_info.get("host", "localhost")
-    user = connection_info.get("user")
-    password = connection_info.get("password")
-    database = connection_info.get("database")
-    port = connection_info.get("port")
-
-    # 如果port为None，设置默认值
-    if port is None:
-        port = 3306 if db_type == "mysql" else 5432
-
-    charset = connection_info.get("charset", "utf8mb4")
-    conn = None
-
-    try:
-        # 建立数据库连接
-        if db_type == "mysql":
-            conn = pymysql.connect(
-                host=host,
-                user=user,
-                password=password,
-                database=database,
-                port=port,
-                charset=charset,
-                cursorclass=pymysql.cursors.DictCursor
-            )
-        elif db_type in ("postgresql", "postgres"):
-            conn = psycopg2.connect(
-                host=host,
-                user=user,
-                password=password,
-                dbname=database,
-                port=port,
-                cursor_factory=RealDictCursor
-            )
-        else:
-            raise ValueError(f"不支持的数据库类型: {db_type}")
-
-        with conn.cursor() as cursor:
-            cursor.execute(sql)
-
-            if sql.strip().lower().startswith(("select", "with", "show")):
-                result = cursor.fetchall()
-                # 统一转换为标准字典格式
-                result = [dict(row) for row in result]
-            else:
-                conn.commit()
-                result = {"affected_rows": cursor.rowcount}
-
-        return result
-
-    except Exception as e:
-        if conn:
-            conn.rollback()
-        raise e
-
-    finally:
-        if conn:
-            conn.close()
-
-
 # 接口实现
-@app.post("/execute_sql", summary="执行SQL语句", response_model=SQLResponse)
+# response_model=None：返回值已是统一格式的字典，跳过FastAPI对响应的二次校验/序列化；
+# OpenAPI文档仍通过responses声明SQLResponse结构
+@app.post("/execute_sql", summary="执行SQL语句", response_model=None,
+          responses={200: {"model": SQLResponse}})
 async def execute_sql_api(request: SQLRequest, background_tasks: BackgroundTasks):
     """
     执行SQL语句并返回结果
 
     - **sql**: 要执行的SQL语句
     - **connection_info**: 数据库连接信息
-    - **async_mode**: 是否异步执行(默认为true)
+    - **async_mode**: 已废弃，所有SQL均通过异步连接池执行
 
     返回统一格式的响应：
     - success: 操作是否成功
@@ -374,11 +425,12 @@ async def execute_sql_api(request: SQLRequest, background_tasks: BackgroundTasks
     - error: 错误信息
     - execution_time: 执行时间(秒)
     """
-    start_time = time.time()
-    sql = request.sql.replace("```sql", "").replace("```", "").strip()
+    # 单调时钟取一次起点，所有耗时统一由它导出
+    start_time = time.perf_counter()
+    sql = _FENCE_RE.sub("", request.sql).strip()
 
     if not sql:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=400,
             content={
                 "success": False,
@@ -388,47 +440,48 @@ async def execute_sql_api(request: SQLRequest, background_tasks: BackgroundTasks
                     "message": "SQL语句不能为空",
                     "suggestion": "请提供有效的SQL语句"
                 },
-                "execution_time": time.time() - start_time
+                "execution_time": time.perf_counter() - start_time
             }
         )
 
+    # 连接信息只导出一次
+    connection_info = request.connection_info.model_dump()
+
+    if not request.async_mode:
+        # 旧的同步路径每次请求新建裸连接，没有池化，已移除
+        logger.warning("async_mode=False 已废弃，SQL将统一通过异步连接池执行")
+
     try:
-        # 根据异步模式选择不同的执行方式
-        if request.async_mode:
-            # 异步执行
-            result = await execute_sql_async(sql, request.connection_info.dict())
-        else:
-            # 在线程池中同步执行
-            result = await asyncio.to_thread(
-                execute_sql_sync,
-                sql,
-                request.connection_info.dict()
-            )
+        # 统一走池化的异步执行路径，计时起点一并传入
+        result = await execute_sql_async(sql, connection_info, start_time)
 
         # 计算执行时间
-        execution_time = time.time() - start_time
+        execution_time = time.perf_counter() - start_time
 
-        # 成功响应使用统一格式
-        return {
+        # 成功响应使用统一格式。result可能含驱动原生类型（Decimal/timedelta/bytes等），
+        # orjson无法直接序列化，因此只对result做一次jsonable_encoder转换，
+        # 响应外层仍绕过response_model的二次校验
+        return ORJSONResponse(content={
             "success": True,
-            "result": result,
+            "result": jsonable_encoder(result),
             "error": None,
             "execution_time": execution_time
-        }
+        })
     except HTTPException as e:
         # HTTPException已在异常处理器中处理
-        e.detail["execution_time"] = time.time() - start_time
+        e.detail["execution_time"] = time.perf_counter() - start_time
         raise e
     except Exception as e:
-        # 未预期的异常
-        execution_time = time.time() - start_time
+        # 未预期的异常：堆栈记入日志，响应只返回类型和消息
+        logger.exception("执行SQL时发生未预期的异常: %s", e)
+        execution_time = time.perf_counter() - start_time
         error_info = {
             "type": type(e).__name__,
             "message": str(e),
             "suggestion": "请联系管理员或检查服务器日志",
             "execution_time": execution_time
         }
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "success": False,
@@ -477,15 +530,28 @@ async def health_check():
     }
 
 
+async def _snap_mysql_pool(pool: aiomysql.Pool) -> Dict[str, int]:
+    """采集单个MySQL连接池的状态快照"""
+    return {"min_size": pool.minsize, "max_size": pool.maxsize, "size": pool.size, "freesize": pool.freesize}
+
+
+async def _snap_pg_pool(pool: asyncpg.Pool) -> Dict[str, int]:
+    """采集单个PostgreSQL连接池的状态快照"""
+    return {"min_size": pool.get_min_size(), "max_size": pool.get_max_size(), "size": pool.get_size(), "idle": pool.get_idle_size()}
+
+
 # 监控端点 - 查看连接池状态
 @app.get("/pools")
 async def pool_status():
-    mysql_status = {k: {"min_size": v.minsize, "max_size": v.maxsize, "size": v.size, "freesize": v.freesize}
-                    for k, v in mysql_pools.items()}
-
-    pg_status = {
-        k: {"min_size": v.get_min_size(), "max_size": v.get_max_size(), "size": v.get_size(), "idle": v.get_idle_size()}
-        for k, v in pg_pools.items()}
+    # 每个池的状态由独立协程一次性采集完，再并发gather，减少对池内部锁的交错争用
+    mysql_keys = tuple(mysql_pools)
+    pg_keys = tuple(pg_pools)
+    snapshots = await asyncio.gather(
+        *[_snap_mysql_pool(p) for p in mysql_pools.values()],
+        *[_snap_pg_pool(p) for p in pg_pools.values()]
+    )
+    mysql_status = dict(zip(mysql_keys, snapshots[:len(mysql_keys)]))
+    pg_status = dict(zip(pg_keys, snapshots[len(mysql_keys):]))
 
     return {
         "success": True,